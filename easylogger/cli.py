@@ -8,15 +8,15 @@ from pathlib import Path
 import typer
 import uvicorn
 
+from .paths import resolve_root
 from .scanner import scan_records
 from .view_store import ViewNotFoundError, default_view, load_view, save_view, view_path
-from .web_api import create_app
 
 app = typer.Typer(add_completion=False, help="EasyLogger CLI")
 
 
 def _resolve_root(root: str) -> Path:
-    root_path = Path(root).expanduser().resolve()
+    root_path = resolve_root(root)
     if not root_path.exists() or not root_path.is_dir():
         raise typer.BadParameter(f"Root path does not exist or is not a directory: {root_path}")
     return root_path
@@ -77,6 +77,9 @@ def view(
         )
         raise typer.Exit(code=1)
 
+    # FastAPI is only needed to serve; `create` starts faster without importing it.
+    from .web_api import create_app
+
     web_app = create_app(root_path, name)
     url = f"http://{host}:{port}"
 
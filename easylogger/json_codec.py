@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import json
+import math
+import mmap
+import os
+import re
+import sys
+from collections.abc import Iterable, Mapping
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+MMAP_THRESHOLD = 64 * 1024
+# While a file is mapped on Windows it cannot be replaced or deleted, which would block
+# log writers and view saves; small JSON files gain nothing there anyway.
+USE_MMAP = orjson is not None and sys.platform != "win32"
+
+# -2**63 and 2**64 - 1 bound what orjson keeps as int: 19 digits with a sign, 20 without.
+_WIDE_INT = re.compile(rb"-\d{19}|\d{20}")
+_WIDE_INT_TEXT = re.compile(r"-\d{19}|\d{20}")
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both backends.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    # orjson turns integers outside the 64-bit range into floats, so documents with digit
+    # runs that long go to the stdlib parser, which keeps them exact.
+    if orjson is not None and not (_WIDE_INT_TEXT if isinstance(data, str) else _WIDE_INT).search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN and Infinity, which json.dump writes by default, are only accepted by the stdlib.
+            pass
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    # Both backends write NaN and infinities as null. orjson rejects ints beyond 64 bits and
+    # non-str keys, which the stdlib encoder handles.
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_default)
+        except orjson.JSONEncodeError:
+            pass
+    try:
+        return _stdlib_dumps(obj)
+    except ValueError:
+        return _stdlib_dumps(_finite(obj))
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(
+        obj, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_default
+    ).encode("utf-8")
+
+
+def _default(obj: Any) -> Any:
+    # Values with no JSON form, mostly from computed columns (sets, generators, objects).
+    # Dates, enums and dataclasses follow what orjson writes natively, so both backends agree.
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        if obj.is_finite() and obj.as_tuple().exponent >= 0:
+            return int(obj)
+        return _finite(float(obj))
+    if isinstance(obj, Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return _finite(dataclasses.asdict(obj))
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return bytes(obj).decode("utf-8", errors="replace")
+    if isinstance(obj, Mapping):
+        return _finite(dict(obj))
+    if isinstance(obj, Iterable):
+        return _finite(list(obj))
+    return str(obj)
+
+
+def _finite(obj: Any) -> Any:
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def load_file(path: str | os.PathLike[str]) -> Any:
+    with open(path, "rb") as handle:
+        if USE_MMAP and orjson is not None and os.fstat(handle.fileno()).st_size > MMAP_THRESHOLD:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                return loads(view)
+        return loads(handle.read())
@@ -5,6 +5,8 @@ from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+from .patterns import compile_pattern
+
 
 class ComputedColumn(BaseModel):
     name: str
@@ -71,7 +73,7 @@ class ViewConfig(BaseModel):
     def _validate_pattern(cls, value: str) -> str:
         text = value.strip()
         try:
-            re.compile(text)
+            compile_pattern(text)
         except re.error as exc:
             raise ValueError(f"Invalid regex pattern: {exc}") from exc
         return text
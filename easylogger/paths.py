@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from pathlib import Path
+
+# Files modified this close to a previous read may have changed within the same timestamp
+# tick (the "racy" case git's index guards against), so results cached from them are not trusted.
+RACY_WINDOW_NS = 2_000_000_000
+
+
+@lru_cache(maxsize=64)
+def _resolve_absolute(root: str) -> Path:
+    return Path(root).resolve()
+
+
+def resolve_root(root: str | Path) -> Path:
+    expanded = os.path.expanduser(os.fspath(root))
+    # Relative roots depend on the working directory, so only absolute ones are cached.
+    if not os.path.isabs(expanded):
+        return Path(expanded).resolve()
+    return _resolve_absolute(expanded)
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+
+@lru_cache(maxsize=128)
+def compile_pattern(pattern: str) -> re.Pattern[str]:
+    # Views are re-validated on every API call, and the scanner compiles the same
+    # patterns again; share one compiled object per pattern string.
+    return re.compile(pattern)
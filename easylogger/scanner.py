@@ -1,13 +1,28 @@
 from __future__ import annotations
 
-import json
+import itertools
 import os
 import re
+import string
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator, Mapping, Sequence
+
+from . import json_codec
+from .paths import RACY_WINDOW_NS, resolve_root
+from .patterns import compile_pattern
 
 DEFAULT_IGNORED_DIRS = {".git", "node_modules", ".venv"}
+PARALLEL_PARSE_THRESHOLD = 64
+READ_BATCH_SIZE = 64
+_PREFIX_CHARS = frozenset(string.ascii_letters + string.digits + "_-/")
+
+_PathMatcher = tuple[Callable[[str], re.Match[str] | None], tuple[str, ...] | None]
 
 
 @dataclass(slots=True)
@@ -16,89 +31,453 @@ class ScanWarning:
     message: str
 
 
+_FileResult = tuple[dict[str, Any] | None, list[ScanWarning]]
+
+
 @dataclass(slots=True)
 class ScanResult:
     records: list[dict[str, Any]]
     warnings: list[ScanWarning]
     summary: dict[str, int]
+    # (mtime_ns, size) per matched path; None when a file could not be stat'ed.
+    file_stats: dict[str, tuple[int, int]] | None = None
+    scanned_at_ns: int = 0
+    # Parse outcome per matched path, so unchanged files can be carried into the next scan.
+    file_results: dict[str, _FileResult] | None = None
 
 
-def _is_supported_scalar(value: Any) -> bool:
-    if value is None:
-        return True
-    if isinstance(value, bool):
-        return True
-    if isinstance(value, (int, float, str)):
-        return True
-    return False
+def _search_pattern(pattern: str) -> str:
+    # A leading ".*" never changes whether search() finds a match, but it makes
+    # the engine retry the greedy prefix from every offset.
+    if pattern.startswith(".*") and pattern[2:3] not in ("*", "+", "?", "{"):
+        return pattern[2:]
+    return pattern
 
 
-def scan_records(root: str | Path, pattern: str, ignored_dirs: set[str] | None = None) -> ScanResult:
-    root_path = Path(root).expanduser().resolve()
-    if not root_path.exists() or not root_path.is_dir():
-        raise ValueError(f"Project root does not exist or is not a directory: {root_path}")
+def _literal_suffix(pattern: str) -> str | None:
+    # The literal text right before a final "$" (e.g. ".scaler.json" for r".*\.scaler\.json$")
+    # must end every matching path, so str.endswith can reject most files before the regex.
+    if "|" in pattern or "(?" in pattern or not _is_unescaped(pattern, len(pattern) - 1, "$"):
+        return None
 
-    try:
-        regex = re.compile(pattern)
-    except re.error as exc:
-        raise ValueError(f"Invalid regex pattern: {exc}") from exc
+    chars: list[str] = []
+    index = len(pattern) - 2
+    while index >= 0:
+        char = pattern[index]
+        if index > 0 and _is_unescaped(pattern, index - 1, "\\"):
+            # A class or numeric escape (\d, \x2e, \101): the text collected so far may be
+            # part of it rather than literal.
+            if char not in string.punctuation:
+                return None
+            chars.append(char)
+            index -= 2
+        elif char in _PREFIX_CHARS and not _is_escaped(pattern, index):
+            chars.append(char)
+            index -= 1
+        else:
+            break
+    return "".join(reversed(chars)) or None
 
-    ignored = ignored_dirs if ignored_dirs is not None else DEFAULT_IGNORED_DIRS
 
-    records: list[dict[str, Any]] = []
-    warnings: list[ScanWarning] = []
-    total_files = 0
-    matched_files = 0
+def _is_escaped(pattern: str, index: int) -> bool:
+    head = pattern[:index]
+    return (len(head) - len(head.rstrip("\\"))) % 2 == 1
 
-    for dirpath, dirnames, filenames in os.walk(root_path, topdown=True):
-        dirnames[:] = [dirname for dirname in dirnames if dirname not in ignored]
 
-        for filename in filenames:
-            total_files += 1
-            file_path = Path(dirpath) / filename
-            rel_path = file_path.relative_to(root_path).as_posix()
-            if not regex.search(rel_path):
-                continue
+def _is_unescaped(pattern: str, index: int, char: str) -> bool:
+    return index >= 0 and pattern[index] == char and not _is_escaped(pattern, index)
+
+
+def _literal_dir_prefix(pattern: str) -> list[str]:
+    # "^logs/run1/.*" can only match under logs/run1, so the walk may start there.
+    if not pattern.startswith("^") or "|" in pattern:
+        return []
+    end = 1
+    while end < len(pattern) and pattern[end] in _PREFIX_CHARS:
+        end += 1
+    literal = pattern[1:end]
+    if pattern[end : end + 1] in ("?", "*", "+", "{"):
+        literal = literal[:-1]
+    parts = literal.split("/")[:-1]
+    if any(not part for part in parts):
+        return []
+    return parts
+
+
+def _pattern_dir_prefix(pattern: str | re.Pattern[str]) -> list[str]:
+    text = _plain_pattern_text(pattern)
+    return _literal_dir_prefix(text) if text is not None else []
+
+
+def _common_dir_prefix(prefixes: Iterable[list[str]]) -> list[str]:
+    common: list[str] | None = None
+    for parts in prefixes:
+        if common is None:
+            common = parts
+            continue
+        size = 0
+        while size < min(len(common), len(parts)) and common[size] == parts[size]:
+            size += 1
+        common = common[:size]
+    return common or []
+
+
+def _walk_start(root: str, parts: list[str], ignored: set[str]) -> str | None:
+    # Descend exactly as the full walk would: the name must match case-sensitively and be
+    # a real, non-ignored directory. Otherwise no path under it can be matched.
+    current = root
+    for part in parts:
+        if part in ignored:
+            return None
+        try:
+            with os.scandir(current) as iterator:
+                entry = next((item for item in iterator if item.name == part), None)
+            if entry is None or entry.is_symlink() or not entry.is_dir():
+                return None
+        except OSError:
+            return None
+        current = entry.path
+    return current
+
 
-            matched_files += 1
+def _walk_files(path: str, ignored: set[str]) -> Iterator[os.DirEntry[str]]:
+    # Iterative pre-order walk: ignored and symlinked directories are never entered, and
+    # deep trees do not stack one generator frame per directory level.
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as iterator:
+                entries = list(iterator)
+        except OSError:
+            continue
 
+        subdirs: list[str] = []
+        for entry in entries:
             try:
-                raw = file_path.read_text(encoding="utf-8")
-                parsed = json.loads(raw)
-            except (OSError, UnicodeDecodeError, json.JSONDecodeError) as exc:
-                warnings.append(
-                    ScanWarning(path=rel_path, message=f"Failed to parse JSON file: {exc}")
-                )
-                continue
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            if not is_dir:
+                yield entry
+            elif entry.name not in ignored and not entry.is_symlink():
+                subdirs.append(entry.path)
+
+        # Reversed so directories are still visited in listing order.
+        stack.extend(reversed(subdirs))
+
+
+def _read_fd(fd: int) -> bytes | None:
+    size = os.fstat(fd).st_size
+    if size > json_codec.MMAP_THRESHOLD:
+        return None
+
+    # A short read on a regular file means EOF, so the common case is a single read call.
+    data = os.read(fd, size + 1)
+    if len(data) <= size:
+        return data
+
+    chunks = [data]
+    while chunk := os.read(fd, 64 * 1024):
+        chunks.append(chunk)
+    return b"".join(chunks)
 
-            if not isinstance(parsed, dict):
-                warnings.append(
-                    ScanWarning(path=rel_path, message="JSON root is not an object; file skipped.")
-                )
-                continue
 
-            row: dict[str, Any] = {"path": rel_path}
-            for key, value in parsed.items():
-                key_name = str(key)
-                if _is_supported_scalar(value):
-                    row[key_name] = value
-                    continue
-
-                row[key_name] = None
-                warnings.append(
-                    ScanWarning(
-                        path=rel_path,
-                        message=f"Field '{key_name}' is not a scalar (array/object); coerced to null.",
-                    )
+def _read_files_batch(paths: Sequence[str]) -> Iterator[tuple[str, bytes | None | OSError]]:
+    # Raw descriptors skip the buffered file object; None marks files left to the mmap path.
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        except OSError as exc:
+            yield path, exc
+            continue
+
+        try:
+            yield path, _read_fd(fd)
+        except OSError as exc:
+            yield path, exc
+        finally:
+            os.close(fd)
+
+
+def _parse_one(
+    path: str, rel_path: str, data: bytes | None | OSError
+) -> _FileResult:
+    try:
+        if isinstance(data, OSError):
+            raise data
+        parsed = json_codec.load_file(path) if data is None else json_codec.loads(data)
+    except (OSError, UnicodeDecodeError, json_codec.JSONDecodeError) as exc:
+        return None, [ScanWarning(path=rel_path, message=f"Failed to parse JSON file: {exc}")]
+
+    if not isinstance(parsed, dict):
+        return None, [ScanWarning(path=rel_path, message="JSON root is not an object; file skipped.")]
+
+    # Column names repeat across every row. orjson already returns cached key objects; the
+    # stdlib decoder allocates fresh ones per document, so intern them on that path.
+    row: dict[str, Any] = {"path": rel_path}
+    if json_codec.orjson is None:
+        row.update(zip(map(sys.intern, parsed), parsed.values()))
+    else:
+        row.update(parsed)
+
+    warnings: list[ScanWarning] = []
+    for key, value in parsed.items():
+        if isinstance(value, (dict, list)):
+            row[key] = None
+            warnings.append(
+                ScanWarning(
+                    path=rel_path,
+                    message=f"Field '{key}' is not a scalar (array/object); coerced to null.",
                 )
+            )
+
+    return row, warnings
 
-            records.append(row)
 
-    summary = {
-        "total_files": total_files,
-        "matched_files": matched_files,
-        "parsed_records": len(records),
-        "warning_count": len(warnings),
+def _parse_batch(
+    batch: Sequence[tuple[str, str]],
+) -> list[_FileResult]:
+    return [_parse_one(path, rel_path, data) for (path, rel_path), data in zip(batch, _read_batch(batch))]
+
+
+def _read_batch(batch: Sequence[tuple[str, str]]) -> list[bytes | None | OSError]:
+    return [data for _, data in _read_files_batch([path for path, _ in batch])]
+
+
+def _parse_all(
+    matched: list[tuple[str, str]],
+) -> list[_FileResult]:
+    if len(matched) < PARALLEL_PARSE_THRESHOLD:
+        return _parse_batch(matched)
+
+    # Only reads go to the pool: os.read releases the GIL, but building parsed objects holds
+    # it with either JSON backend, so parsing stays on this thread and consumes batches in
+    # submission order while later ones are read. A bounded window of batches in flight
+    # caps how much raw file data is held at once. Parsing 5000 small files with a cold
+    # page cache took about 0.20 s this way against 0.26 s sequentially; warm, they are even.
+    batches = [matched[start : start + READ_BATCH_SIZE] for start in range(0, len(matched), READ_BATCH_SIZE)]
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(batches))
+    results: list[_FileResult] = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        in_flight: deque[Future[list[bytes | None | OSError]]] = deque()
+        pending = iter(batches)
+        for batch in itertools.islice(pending, max_workers * 2):
+            in_flight.append(executor.submit(_read_batch, batch))
+        for batch in batches:
+            contents = in_flight.popleft().result()
+            next_batch = next(pending, None)
+            if next_batch is not None:
+                in_flight.append(executor.submit(_read_batch, next_batch))
+            results.extend(
+                _parse_one(path, rel_path, data) for (path, rel_path), data in zip(batch, contents)
+            )
+    return results
+
+
+def _file_stat(entry: os.DirEntry[str]) -> tuple[int, int] | None:
+    try:
+        stat = entry.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _can_reuse(
+    previous: ScanResult | None,
+    file_stats: dict[str, tuple[int, int]] | None,
+    total_files: int,
+) -> bool:
+    if previous is None or file_stats is None or previous.file_stats != file_stats:
+        return False
+    if previous.summary["total_files"] != total_files:
+        return False
+    cutoff = previous.scanned_at_ns - RACY_WINDOW_NS
+    return all(mtime_ns < cutoff for mtime_ns, _ in file_stats.values())
+
+
+def _reusable_files(
+    previous: ScanResult | None,
+    current: Sequence[tuple[int, str, tuple[int, int] | None]],
+) -> dict[int, _FileResult]:
+    if previous is None or not previous.file_stats or not previous.file_results:
+        return {}
+
+    # Looked up by the file's relative path: a row's own "path" value can come from the log
+    # itself and need not name the file it was parsed from.
+    previous_stats = previous.file_stats
+    previous_results = previous.file_results
+    cutoff = previous.scanned_at_ns - RACY_WINDOW_NS
+    return {
+        index: previous_results[rel_path]
+        for index, rel_path, stat in current
+        if stat is not None
+        and stat[0] < cutoff
+        and previous_stats.get(rel_path) == stat
+        and rel_path in previous_results
+    }
+
+
+@lru_cache(maxsize=128)
+def _compile_matcher(pattern: str | re.Pattern[str]) -> _PathMatcher:
+    if isinstance(pattern, re.Pattern):
+        text = _plain_pattern_text(pattern)
+        search = pattern.search if text is None else compile_pattern(_search_pattern(text)).search
+    else:
+        try:
+            compile_pattern(pattern)
+        except re.error as exc:
+            raise ValueError(f"Invalid regex pattern: {exc}") from exc
+        text = pattern
+        search = compile_pattern(_search_pattern(pattern)).search
+
+    # Only the part after the last "/" can be checked against the entry name alone.
+    suffix = ((_literal_suffix(text) if text is not None else None) or "").rpartition("/")[2]
+    suffixes = (suffix, suffix + "\n") if suffix else None
+    return search, suffixes
+
+
+def _plain_pattern_text(pattern: str | re.Pattern[str]) -> str | None:
+    # Pattern source is only analysed for literal prefixes/suffixes when no flags (e.g.
+    # IGNORECASE, MULTILINE, VERBOSE) change what that text means.
+    if isinstance(pattern, str):
+        return pattern
+    return pattern.pattern if pattern.flags == re.UNICODE else None
+
+
+def _scan_many(
+    root: str | Path,
+    patterns: Mapping[str, str | re.Pattern[str]],
+    ignored_dirs: set[str] | None,
+    previous: Mapping[str, ScanResult],
+) -> dict[str, ScanResult]:
+    root_path = resolve_root(root)
+    if not root_path.is_dir():
+        raise ValueError(f"Project root does not exist or is not a directory: {root_path}")
+
+    matchers = {key: _compile_matcher(pattern) for key, pattern in patterns.items()}
+    ignored = ignored_dirs if ignored_dirs is not None else DEFAULT_IGNORED_DIRS
+
+    scanned_at_ns = time.time_ns()
+    total_files = 0
+    # Files matched by at least one pattern, in walk order, each stat'ed once.
+    files: list[tuple[str, str]] = []
+    stats: list[tuple[int, int] | None] = []
+    matched_by: dict[str, list[int]] = {key: [] for key in matchers}
+
+    root_str = str(root_path)
+    # Every entry path is root_str joined with the relative path, so slicing off the root
+    # is enough; os.path.relpath would re-split and re-join both paths for each file.
+    prefix_len = len(root_str) if root_str.endswith(os.sep) else len(root_str) + 1
+    native_sep = os.sep == "/"
+    dir_prefixes = {key: _pattern_dir_prefix(pattern) for key, pattern in patterns.items()}
+    common = _common_dir_prefix(dir_prefixes.values())
+    # The walk only narrows to the prefix shared by every pattern. Patterns anchored deeper
+    # count just the files under their own prefix, as a scan of that pattern alone would.
+    root_base = root_str if root_str.endswith(os.sep) else root_str + os.sep
+    scoped = {
+        key: root_base + os.sep.join(parts) + os.sep
+        for key, parts in dir_prefixes.items()
+        if len(parts) > len(common)
     }
+    scoped_totals = dict.fromkeys(scoped, 0)
+    start = _walk_start(root_str, common, ignored)
+    for entry in _walk_files(start, ignored) if start is not None else ():
+        total_files += 1
+        for key, scope_prefix in scoped.items():
+            if entry.path.startswith(scope_prefix):
+                scoped_totals[key] += 1
+        name = entry.name
+        rel_path = None
+        index = None
+        for key, (search, suffixes) in matchers.items():
+            if suffixes and not name.endswith(suffixes):
+                continue
+            if rel_path is None:
+                rel_path = entry.path[prefix_len:]
+                if not native_sep:
+                    rel_path = rel_path.replace(os.sep, "/")
+            if not search(rel_path):
+                continue
+            if index is None:
+                index = len(files)
+                files.append((entry.path, rel_path))
+                stats.append(_file_stat(entry))
+            matched_by[key].append(index)
+
+    results: dict[str, ScanResult] = {}
+    pending: list[tuple[str, list[int], dict[str, tuple[int, int]] | None, dict[int, _FileResult]]] = []
+    to_parse: set[int] = set()
+    for key, indexes in matched_by.items():
+        file_stats: dict[str, tuple[int, int]] | None = {}
+        for index in indexes:
+            stat = stats[index]
+            if stat is None:
+                file_stats = None
+                break
+            file_stats[files[index][1]] = stat
+
+        # Same matched files with unchanged mtime/size: reuse the previous result as a whole.
+        # Otherwise only files that changed (or are new) are read again. Callers must pass
+        # results produced for the same pattern.
+        prior = previous.get(key)
+        if _can_reuse(prior, file_stats, scoped_totals.get(key, total_files)):
+            results[key] = prior
+            continue
+        reused = _reusable_files(prior, [(index, files[index][1], stats[index]) for index in indexes])
+        pending.append((key, indexes, file_stats, reused))
+        to_parse.update(index for index in indexes if index not in reused)
+
+    # Files shared between patterns are read and parsed once.
+    parse_order = sorted(to_parse)
+    parsed = dict(zip(parse_order, _parse_all([files[index] for index in parse_order])))
+
+    for key, indexes, file_stats, reused in pending:
+        records: list[dict[str, Any]] = []
+        warnings: list[ScanWarning] = []
+        file_results: dict[str, _FileResult] = {}
+        for index in indexes:
+            result = reused[index] if index in reused else parsed[index]
+            file_results[files[index][1]] = result
+            row, row_warnings = result
+            if row is not None:
+                records.append(row)
+            warnings.extend(row_warnings)
+
+        summary = {
+            "total_files": scoped_totals.get(key, total_files),
+            "matched_files": len(indexes),
+            "parsed_records": len(records),
+            "warning_count": len(warnings),
+        }
+        results[key] = ScanResult(
+            records=records,
+            warnings=warnings,
+            summary=summary,
+            file_stats=file_stats,
+            scanned_at_ns=scanned_at_ns,
+            file_results=file_results,
+        )
+
+    return {key: results[key] for key in matchers}
+
+
+def scan_records(
+    root: str | Path,
+    pattern: str | re.Pattern[str],
+    ignored_dirs: set[str] | None = None,
+    previous: ScanResult | None = None,
+) -> ScanResult:
+    prior = {"": previous} if previous is not None else {}
+    return _scan_many(root, {"": pattern}, ignored_dirs, prior)[""]
+
 
-    return ScanResult(records=records, warnings=warnings, summary=summary)
+def scan_records_multi(
+    root: str | Path,
+    patterns: Mapping[str, str | re.Pattern[str]],
+    ignored_dirs: set[str] | None = None,
+    previous: Mapping[str, ScanResult] | None = None,
+) -> dict[str, ScanResult]:
+    # One walk for every pattern (e.g. one per view); each matching file is parsed once
+    # and its row shared by all results that include it.
+    return _scan_many(root, patterns, ignored_dirs, previous or {})
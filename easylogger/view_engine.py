@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-import math
 import re
 from dataclasses import dataclass
-from typing import Any, Iterable, Sequence
+from functools import lru_cache
+from operator import itemgetter
+from types import CodeType
+from typing import Any, Callable, Iterable, Sequence
 
 from .models import ViewConfig
 
 _NUMERIC_RE = re.compile(r"^[+-]?(?:\d+(?:\.\d*)?|\.\d+)$")
+_CACHED_TEXT_LENGTH = 32
 
 
 @dataclass(slots=True)
@@ -17,78 +20,131 @@ class TableResult:
     rows: list[dict[str, Any]]
 
 
+# The parts of a ViewConfig the engine reads, flattened once per apply_view call so the
+# per-row passes touch plain slots instead of walking nested models.
+@dataclass(slots=True)
+class _ViewPlan:
+    order: list[str]
+    hidden: frozenset[str]
+    computed: list[tuple[str, str]]
+    formats: list[tuple[str, Callable[..., str]]]
+    pinned_index: dict[str, int]
+    sort_field: str | None
+    reverse: bool
+
+    @classmethod
+    def from_view(cls, view: ViewConfig) -> "_ViewPlan":
+        columns = view.columns
+        rows = view.rows
+        return cls(
+            order=list(columns.order),
+            hidden=frozenset(columns.hidden),
+            computed=[(item.name, item.expr) for item in columns.computed],
+            formats=[
+                (name, template.format)
+                for name, template in columns.format.items()
+                if isinstance(template, str) and template
+            ],
+            pinned_index={pinned_id: index for index, pinned_id in enumerate(rows.pinned_ids)},
+            sort_field=rows.sort.by,
+            reverse=rows.sort.direction == "desc",
+        )
+
+
 def apply_view(records: Sequence[dict[str, Any]], view: ViewConfig) -> TableResult:
-    rows, all_columns = _normalize_rows(records)
-    _apply_computed_columns(rows, all_columns, view)
+    plan = _ViewPlan.from_view(view)
+    # Computed columns and display formats write into rows; without them rows are only read.
+    read_only = not plan.computed and not plan.formats
+    rows, all_columns = _normalize_rows(records, reuse_dense=read_only)
+    _apply_computed_columns(rows, all_columns, plan)
 
-    ordered_columns = _ordered_columns(view.columns.order, all_columns)
-    hidden_set = set(view.columns.hidden)
-    visible_columns = [column for column in ordered_columns if column not in hidden_set]
+    ordered_columns = _ordered_columns(plan.order, all_columns)
+    visible_columns = [column for column in ordered_columns if column not in plan.hidden]
 
-    sorted_rows = _sort_rows(rows, view)
-    _apply_display_formats(sorted_rows, view)
+    sorted_rows = _sort_rows(rows, plan)
+    _apply_display_formats(sorted_rows, plan)
     return TableResult(all_columns=ordered_columns, visible_columns=visible_columns, rows=sorted_rows)
 
 
-def _normalize_rows(records: Sequence[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[str]]:
-    discovered_columns: list[str] = ["path"]
-    seen = {"path"}
-    normalized_rows: list[dict[str, Any]] = []
-
+def _normalize_rows(
+    records: Sequence[dict[str, Any]], reuse_dense: bool = False
+) -> tuple[list[dict[str, Any]], list[str]]:
+    # Discover every column first so each row is built by one C-level merge over a
+    # None-filled template instead of a per-row, per-column setdefault pass.
+    columns: dict[str, None] = {"path": None}
     for record in records:
-        copied = dict(record)
-        copied.setdefault("path", None)
-        normalized_rows.append(copied)
-
-        for key in copied.keys():
-            if key in seen:
-                continue
-            seen.add(key)
-            discovered_columns.append(key)
-
-    for row in normalized_rows:
-        for column in discovered_columns:
-            row.setdefault(column, None)
-
-    return normalized_rows, discovered_columns
-
-
-def _apply_computed_columns(rows: list[dict[str, Any]], all_columns: list[str], view: ViewConfig) -> None:
-    builtins_scope = {"__builtins__": __builtins__}
-
-    for computed in view.columns.computed:
-        if computed.name not in all_columns:
-            all_columns.append(computed.name)
+        for key in record:
+            if key not in columns:
+                columns[key] = None
+
+    # A record holding as many keys as there are columns already has every column; when the
+    # caller will not write into rows it can be passed through without a copy.
+    width = len(columns)
+    normalized_rows = [
+        record if reuse_dense and len(record) == width else {**columns, **record}
+        for record in records
+    ]
+    return normalized_rows, list(columns)
+
+
+@lru_cache(maxsize=256)
+def _compile_expression(expr: str) -> CodeType:
+    return compile(expr, "<computed>", "eval")
+
+
+def _apply_computed_columns(rows: list[dict[str, Any]], all_columns: list[str], plan: _ViewPlan) -> None:
+    # One namespace for every row: only "row" changes between evals. Holding row as a global
+    # (not an eval local) also lets comprehensions inside an expression see it.
+    scope: dict[str, Any] = {"__builtins__": __builtins__, "row": None}
+    known_columns = set(all_columns)
+
+    for name, expr in plan.computed:
+        if name not in known_columns:
+            all_columns.append(name)
+            known_columns.add(name)
+
+        try:
+            code = _compile_expression(expr)
+        except Exception as exc:
+            error = f"ERROR: {exc}"
+            for row in rows:
+                row[name] = error
+            continue
 
         for row in rows:
+            scope["row"] = row
             try:
-                value = eval(computed.expr, builtins_scope, {"row": row})  # noqa: S307
+                value = eval(code, scope)  # noqa: S307
             except Exception as exc:
                 value = f"ERROR: {exc}"
-            row[computed.name] = value
+            row[name] = value
+            # Names an expression binds (e.g. with :=) land in the shared namespace; drop
+            # them so they never leak into later rows or columns.
+            if len(scope) > 2:
+                scope = {"__builtins__": __builtins__, "row": None}
 
 
 def _ordered_columns(configured_order: Iterable[str], all_columns: list[str]) -> list[str]:
+    # Views can list hundreds of columns, so membership goes through sets, never the lists.
+    known = set(all_columns)
     ordered: list[str] = []
     seen: set[str] = set()
 
     for column in configured_order:
-        if column in all_columns and column not in seen:
+        if column in known and column not in seen:
             ordered.append(column)
             seen.add(column)
 
-    for column in all_columns:
-        if column in seen:
-            continue
-        ordered.append(column)
-        seen.add(column)
-
+    ordered.extend(column for column in all_columns if column not in seen)
     return ordered
 
 
-def _sort_rows(rows: list[dict[str, Any]], view: ViewConfig) -> list[dict[str, Any]]:
-    pinned_ids = view.rows.pinned_ids
-    pinned_index = {pinned_id: index for index, pinned_id in enumerate(pinned_ids)}
+def _sort_rows(rows: list[dict[str, Any]], plan: _ViewPlan) -> list[dict[str, Any]]:
+    pinned_index = plan.pinned_index
+    sort_field = plan.sort_field
+    # Without pins there is nothing to split off, so the rows go straight to the sort.
+    if not pinned_index:
+        return _sort_by_field(rows, sort_field, plan.reverse) if sort_field else rows
 
     pinned_rows: list[dict[str, Any]] = []
     other_rows: list[dict[str, Any]] = []
@@ -102,61 +158,100 @@ def _sort_rows(rows: list[dict[str, Any]], view: ViewConfig) -> list[dict[str, A
 
     pinned_rows.sort(key=lambda row: pinned_index[row["path"]])
 
-    sort_field = view.rows.sort.by
     if sort_field:
-        reverse = view.rows.sort.direction == "desc"
-        other_rows.sort(key=lambda row: _sortable_value(row.get(sort_field)), reverse=reverse)
+        other_rows = _sort_by_field(other_rows, sort_field, plan.reverse)
 
     return pinned_rows + other_rows
 
 
-def _apply_display_formats(rows: list[dict[str, Any]], view: ViewConfig) -> None:
-    for column_name, template in view.columns.format.items():
-        if not isinstance(template, str) or not template:
+def _sort_by_field(rows: list[dict[str, Any]], field: str, reverse: bool) -> list[dict[str, Any]]:
+    # Numbers sort before text, and missing values come last. Rows are split into those
+    # buckets in one pass so each bucket sorts on a bare float/str key rather than a tuple
+    # built per row; NaN sorts as its text form.
+    numeric_keys: list[float] = []
+    numeric_rows: list[dict[str, Any]] = []
+    text_keys: list[str] = []
+    text_rows: list[dict[str, Any]] = []
+    missing_rows: list[dict[str, Any]] = []
+
+    for row in rows:
+        value = row.get(field)
+        value_type = type(value)
+        if value_type is int or value_type is float:
+            numeric = float(value)
+        elif value is None:
+            missing_rows.append(row)
             continue
-        for row in rows:
-            if column_name not in row:
+        else:
+            numeric = _to_float(value)
+            if numeric is None:
+                text_keys.append(str(value))
+                text_rows.append(row)
                 continue
-            value = row[column_name]
+        if numeric != numeric:
+            text_keys.append(str(value))
+            text_rows.append(row)
+        else:
+            numeric_keys.append(numeric)
+            numeric_rows.append(row)
+
+    buckets = [
+        [row for _, row in sorted(zip(keys, bucket_rows), key=itemgetter(0), reverse=reverse)]
+        for keys, bucket_rows in ((numeric_keys, numeric_rows), (text_keys, text_rows))
+    ]
+    buckets.append(missing_rows)
+    if reverse:
+        buckets.reverse()
+    return [row for bucket in buckets for row in bucket]
+
+
+def _apply_display_formats(rows: list[dict[str, Any]], plan: _ViewPlan) -> None:
+    # Templates are held as bound str.format methods. They are not probed up front: whether
+    # a spec is valid depends on the value type (e.g. "{d:s}" rejects numbers only).
+    for column_name, render in plan.formats:
+        for row in rows:
+            value = row.get(column_name)
             if value is None:
                 continue
             try:
-                row[column_name] = template.format(d=_coerce_format_value(value))
+                row[column_name] = render(d=_coerce_format_value(value) if type(value) is str else value)
             except Exception as exc:
                 row[column_name] = f"FORMAT_ERROR: {exc}"
 
 
 def _coerce_format_value(value: Any) -> Any:
-    if isinstance(value, str):
-        stripped = value.strip()
-        if _NUMERIC_RE.match(stripped):
-            if "." not in stripped:
-                try:
-                    return int(stripped)
-                except ValueError:
-                    return float(stripped)
-            return float(stripped)
-    return value
-
-
-def _sortable_value(value: Any) -> tuple[int, Any]:
-    numeric = _to_float(value)
-    if numeric is not None and not math.isnan(numeric):
-        return (0, numeric)
-
-    if value is None:
-        return (2, "")
-
-    return (1, str(value))
+    if type(value) is not str:
+        return value
+    parsed = _parse_cached_text(value) if len(value) <= _CACHED_TEXT_LENGTH else _parse_text(value)
+    return value if parsed is None else parsed[0]
 
 
 def _to_float(value: Any) -> float | None:
-    if isinstance(value, bool):
+    value_type = type(value)
+    if value_type is str:
+        parsed = _parse_cached_text(value) if len(value) <= _CACHED_TEXT_LENGTH else _parse_text(value)
+        return None if parsed is None else parsed[1]
+    if value_type is bool:
         return None
     if isinstance(value, (int, float)):
         return float(value)
-    if isinstance(value, str):
-        stripped = value.strip()
-        if _NUMERIC_RE.match(stripped):
-            return float(stripped)
     return None
+
+
+def _parse_text(text: str) -> tuple[int | float, float] | None:
+    # (value for display formats, value for sorting).
+    stripped = text.strip()
+    if not _NUMERIC_RE.match(stripped):
+        return None
+    as_float = float(stripped)
+    if "." not in stripped:
+        try:
+            return int(stripped), as_float
+        except ValueError:
+            pass
+    return as_float, as_float
+
+
+# Short cells (steps, run names) repeat across many rows, so their parse is cached. Longer
+# text such as notes is parsed directly and never kept alive by the cache.
+_parse_cached_text = lru_cache(maxsize=4096)(_parse_text)
@@ -1,9 +1,24 @@
 from __future__ import annotations
 
-import json
+import os
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
+from pydantic import ValidationError
+from pydantic_core import to_json
+
+from . import json_codec
 from .models import ViewConfig
+from .paths import RACY_WINDOW_NS, resolve_root
+
+_VIEW_CACHE_SIZE = 128
+# Parsed views keyed by file path, valid while (mtime_ns, size) is unchanged. Cached views
+# are shared between callers and must be copied before they are modified.
+_view_cache: dict[Path, tuple[int, int, ViewConfig]] = {}
+_view_cache_lock = threading.Lock()
 
 
 class ViewNotFoundError(FileNotFoundError):
@@ -19,8 +34,13 @@ def _normalize_name(name: str) -> str:
     return normalized
 
 
+@lru_cache(maxsize=64)
+def _views_dir_under(root_path: Path) -> Path:
+    return root_path / ".easylogger" / "views"
+
+
 def views_dir(root: str | Path) -> Path:
-    return Path(root).expanduser().resolve() / ".easylogger" / "views"
+    return _views_dir_under(resolve_root(root))
 
 
 def view_path(root: str | Path, name: str) -> Path:
@@ -28,10 +48,17 @@ def view_path(root: str | Path, name: str) -> Path:
 
 
 def list_views(root: str | Path) -> list[str]:
-    base = views_dir(root)
-    if not base.exists():
+    try:
+        with os.scandir(views_dir(root)) as entries:
+            names = [
+                entry.name[:-5]
+                for entry in entries
+                if entry.name.endswith(".json") and len(entry.name) > 5 and entry.is_file()
+            ]
+    except FileNotFoundError:
         return []
-    return sorted(path.stem for path in base.glob("*.json"))
+    names.sort()
+    return names
 
 
 def default_view(name: str, pattern: str) -> ViewConfig:
@@ -61,27 +88,74 @@ def default_view(name: str, pattern: str) -> ViewConfig:
 def save_view(root: str | Path, view: ViewConfig) -> Path:
     target = view_path(root, view.name)
     target.parent.mkdir(parents=True, exist_ok=True)
-    target.write_text(view.model_dump_json(indent=2), encoding="utf-8")
+    # Written beside the target and swapped in, so readers never see a half-written view.
+    # The temporary name is per writer and does not end in .json, keeping it out of list_views.
+    temporary = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(temporary, "wb") as handle:
+            handle.write(to_json(view, indent=2))
+        os.replace(temporary, target)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+    _forget_view(target)
     return target
 
 
 def load_view(root: str | Path, name: str) -> ViewConfig:
     target = view_path(root, name)
-    if not target.exists():
-        root_path = Path(root).expanduser().resolve()
+    try:
+        # The stat doubles as the existence check and the cache key.
+        stat = os.stat(target)
+    except FileNotFoundError:
+        root_path = resolve_root(root)
         msg = (
             f"View '{name}' does not exist under root '{root_path}'. "
             f"Create one with: easylogger create {root_path} --pattern \"...\" --name \"{name}\""
         )
-        raise ViewNotFoundError(msg)
+        raise ViewNotFoundError(msg) from None
+    except OSError as exc:
+        raise ValueError(f"Failed to read view file: {target} ({exc})") from exc
 
     try:
-        raw = target.read_text(encoding="utf-8")
-        payload = json.loads(raw)
-    except (OSError, json.JSONDecodeError) as exc:
+        with _view_cache_lock:
+            cached = _view_cache.get(target)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        # Small files go to pydantic as raw JSON, parsed and validated in one pass; large
+        # ones keep json_codec's mmap path.
+        if stat.st_size > json_codec.MMAP_THRESHOLD:
+            payload = json_codec.load_file(target)
+        else:
+            payload = target.read_bytes()
+    except (OSError, UnicodeDecodeError, json_codec.JSONDecodeError) as exc:
         raise ValueError(f"Failed to read view file: {target} ({exc})") from exc
 
-    return ViewConfig.model_validate(payload)
+    view = _validate_view(target, payload)
+    # A file written within the racy window may be rewritten again without its mtime or
+    # size changing, so only settled files are cached.
+    if stat.st_mtime_ns < time.time_ns() - RACY_WINDOW_NS:
+        with _view_cache_lock:
+            if len(_view_cache) >= _VIEW_CACHE_SIZE:
+                _view_cache.pop(next(iter(_view_cache)))
+            _view_cache[target] = (stat.st_mtime_ns, stat.st_size, view)
+    return view
+
+
+def _validate_view(target: Path, payload: Any) -> ViewConfig:
+    if not isinstance(payload, bytes):
+        return ViewConfig.model_validate(payload)
+    try:
+        return ViewConfig.model_validate_json(payload)
+    except ValidationError as exc:
+        if any(error["type"] == "json_invalid" for error in exc.errors()):
+            raise ValueError(f"Failed to read view file: {target} ({exc})") from exc
+        raise
+
+
+def _forget_view(target: Path) -> None:
+    with _view_cache_lock:
+        _view_cache.pop(target, None)
 
 
 def create_view_from(root: str | Path, name: str, from_name: str) -> ViewConfig:
@@ -111,8 +185,9 @@ def rename_view(root: str | Path, old_name: str, new_name: str) -> ViewConfig:
     if new_path.exists():
         raise ValueError(f"View '{new_normalized}' already exists.")
 
-    view = load_view(root, old_normalized)
+    view = load_view(root, old_normalized).model_copy(deep=True)
     view.name = new_normalized
     save_view(root, view)
     old_path.unlink(missing_ok=True)
+    _forget_view(old_path)
     return view
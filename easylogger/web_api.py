@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any, Iterator
 
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import FileResponse
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 
+from . import json_codec
 from .models import CreateViewRequest, RenameViewRequest, ScanRequest, ViewConfig
-from .scanner import scan_records
+from .paths import resolve_root
+from .scanner import ScanResult, scan_records
 from .view_engine import apply_view
 from .view_store import (
     ViewNotFoundError,
@@ -19,16 +22,58 @@ from .view_store import (
 )
 
 
+STREAM_CHUNK_ROWS = 512
+
+
+def _stream_table_payload(payload: dict[str, Any]) -> Iterator[bytes]:
+    # Emits the same object as json_codec.dumps(payload), with "rows" encoded a chunk at a
+    # time so the full response body is never held in memory at once.
+    rows = payload["rows"]
+    head = {key: value for key, value in payload.items() if key not in ("rows", "warnings")}
+    yield json_codec.dumps(head)[:-1] + b',"rows":['
+    for start in range(0, len(rows), STREAM_CHUNK_ROWS):
+        chunk = _encode_rows(rows[start : start + STREAM_CHUNK_ROWS])[1:-1]
+        yield b"," + chunk if start else chunk
+    yield b'],"warnings":' + json_codec.dumps(payload["warnings"]) + b"}"
+
+
+def _encode_table_payload(payload: dict[str, Any]) -> bytes:
+    # Same body as the streamed form, including its per-cell fallback for unencodable values.
+    try:
+        return json_codec.dumps(payload)
+    except (TypeError, ValueError, RecursionError):
+        return b"".join(_stream_table_payload(payload))
+
+
+def _encode_rows(rows: list[dict[str, Any]]) -> bytes:
+    # The status line is already sent while rows are encoded, so a value that still cannot
+    # be encoded (e.g. a self-referencing list) becomes an error cell instead of a cut-off body.
+    try:
+        return json_codec.dumps(rows)
+    except (TypeError, ValueError, RecursionError):
+        return json_codec.dumps([{key: _encodable(value) for key, value in row.items()} for row in rows])
+
+
+def _encodable(value: Any) -> Any:
+    try:
+        json_codec.dumps(value)
+    except (TypeError, ValueError, RecursionError) as exc:
+        return f"ENCODE_ERROR: {exc}"
+    return value
+
+
 def create_app(root: str | Path, view_name: str) -> FastAPI:
-    root_path = Path(root).expanduser().resolve()
+    root_path = resolve_root(root)
     web_root = Path(__file__).resolve().parent / "web"
 
     app = FastAPI(title="EasyLogger")
     app.mount("/static", StaticFiles(directory=web_root), name="static")
 
     active_view_name = view_name
-    cached_records: dict[str, list[dict]] = {}
-    cached_scan_meta: dict[str, tuple[dict, list[dict]]] = {}
+    # Last scan per view name, with the pattern it was produced for.
+    cached_scans: dict[str, tuple[str, ScanResult]] = {}
+    # Last /api/render body per view name, with the scan and view JSON it was built from.
+    cached_renders: dict[str, tuple[ScanResult, str, bytes]] = {}
 
     def _load_view_or_404(name: str) -> ViewConfig:
         try:
@@ -54,16 +99,19 @@ def create_app(root: str | Path, view_name: str) -> FastAPI:
         active_view_name = target_name
         return target_name, view
 
-    def _response_from_records(
-        records: list[dict],
-        active_view: ViewConfig,
-        summary: dict,
-        warnings: list[dict],
-    ) -> dict:
-        table = apply_view(records, active_view)
+    def _scan(name: str, pattern: str) -> ScanResult:
+        cached = cached_scans.get(name)
+        previous = cached[1] if cached is not None and cached[0] == pattern else None
+        scan_result = scan_records(root_path, pattern, previous=previous)
+        cached_scans[name] = (pattern, scan_result)
+        return scan_result
+
+    def _payload_from_scan(scan_result: ScanResult, active_view: ViewConfig) -> dict[str, Any]:
+        # Cached records are shared with apply_view, which copies a row only when the view
+        # writes into it (computed columns, formats); read-only views pass them through.
+        table = apply_view(scan_result.records, active_view)
         return {
-            "summary": summary,
-            "warnings": warnings,
+            "summary": scan_result.summary,
             "columns": {
                 "all": table.all_columns,
                 "visible": table.visible_columns,
@@ -71,6 +119,10 @@ def create_app(root: str | Path, view_name: str) -> FastAPI:
                 "alias": active_view.columns.alias,
             },
             "rows": table.rows,
+            "warnings": [
+                {"path": warning.path, "message": warning.message}
+                for warning in scan_result.warnings
+            ],
         }
 
     @app.get("/api/meta")
@@ -124,10 +176,9 @@ def create_app(root: str | Path, view_name: str) -> FastAPI:
         if active_view_name == request.old_name:
             active_view_name = request.new_name
 
-        if request.old_name in cached_records:
-            cached_records[request.new_name] = cached_records.pop(request.old_name)
-        if request.old_name in cached_scan_meta:
-            cached_scan_meta[request.new_name] = cached_scan_meta.pop(request.old_name)
+        if request.old_name in cached_scans:
+            cached_scans[request.new_name] = cached_scans.pop(request.old_name)
+        cached_renders.pop(request.old_name, None)
 
         return renamed
 
@@ -150,53 +201,38 @@ def create_app(root: str | Path, view_name: str) -> FastAPI:
         return view
 
     @app.post("/api/scan")
-    def post_scan(request: ScanRequest | None = None) -> dict:
+    def post_scan(request: ScanRequest | None = None) -> StreamingResponse:
         resolved_name, active_view = _resolve_view_and_name(request)
+        scan_result = _scan(resolved_name, active_view.pattern)
+        payload = _payload_from_scan(scan_result, active_view)
+        return StreamingResponse(_stream_table_payload(payload), media_type="application/json")
 
-        scan_result = scan_records(root_path, active_view.pattern)
-        records = [dict(record) for record in scan_result.records]
-        warnings = [
-            {"path": warning.path, "message": warning.message}
-            for warning in scan_result.warnings
-        ]
+    @app.post("/api/render")
+    def post_render(request: ScanRequest | None = None) -> Response:
+        resolved_name, active_view = _resolve_view_and_name(request)
 
-        cached_records[resolved_name] = records
-        cached_scan_meta[resolved_name] = (scan_result.summary, warnings)
+        cached = cached_scans.get(resolved_name)
+        if cached is None:
+            scan_result = _scan(resolved_name, active_view.pattern)
+        else:
+            scan_result = cached[1]
 
-        return _response_from_records(records, active_view, scan_result.summary, warnings)
+        # The frontend re-renders with an unchanged view (e.g. after saving); replay the
+        # encoded body instead of re-running the view pipeline.
+        view_key = active_view.model_dump_json()
+        rendered = cached_renders.get(resolved_name)
+        if rendered is not None and rendered[0] is scan_result and rendered[1] == view_key:
+            return Response(rendered[2], media_type="application/json")
 
-    @app.post("/api/render")
-    def post_render(request: ScanRequest | None = None) -> dict:
-        resolved_name, active_view = _resolve_view_and_name(request)
+        body = _encode_table_payload(_payload_from_scan(scan_result, active_view))
+        cached_renders[resolved_name] = (scan_result, view_key, body)
+        return Response(body, media_type="application/json")
 
-        if resolved_name not in cached_records:
-            scan_result = scan_records(root_path, active_view.pattern)
-            records = [dict(record) for record in scan_result.records]
-            warnings = [
-                {"path": warning.path, "message": warning.message}
-                for warning in scan_result.warnings
-            ]
-            cached_records[resolved_name] = records
-            cached_scan_meta[resolved_name] = (scan_result.summary, warnings)
-            return _response_from_records(records, active_view, scan_result.summary, warnings)
-
-        summary, warnings = cached_scan_meta.get(
-            resolved_name,
-            (
-                {
-                    "total_files": 0,
-                    "matched_files": 0,
-                    "parsed_records": len(cached_records[resolved_name]),
-                    "warning_count": 0,
-                },
-                [],
-            ),
-        )
-        records = [dict(record) for record in cached_records[resolved_name]]
-        return _response_from_records(records, active_view, summary, warnings)
+    # index.html is a small fixed shell; read it once instead of per request.
+    index_html = (web_root / "index.html").read_bytes()
 
     @app.get("/")
-    def index() -> FileResponse:
-        return FileResponse(web_root / "index.html")
+    def index() -> HTMLResponse:
+        return HTMLResponse(index_html)
 
     return app
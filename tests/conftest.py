@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+import uvicorn
+
+from easylogger.view_store import default_view, save_view
+from easylogger.web_api import create_app
+
+
+def _chromium_executable() -> Path | None:
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        return None
+    with sync_playwright() as playwright:
+        return Path(playwright.chromium.executable_path)
+
+
+def pytest_collection_finish(session: pytest.Session) -> None:
+    # Checked once per session, and only when browser tests were collected. The path
+    # Playwright reports is pinned to its own browser revision, so an upgrade installs the
+    # matching build. CI can cache the browsers directory keyed on the Playwright version.
+    # Playwright locks that directory while installing, so concurrent xdist workers are safe.
+    if not any("browser" in getattr(item, "fixturenames", ()) for item in session.items):
+        return
+    executable = _chromium_executable()
+    if executable is None or executable.exists():
+        return
+    # A failed or hung install is left to the browser fixture, which skips when launch fails.
+    try:
+        subprocess.run([sys.executable, "-m", "playwright", "install", "chromium"], check=False, timeout=600)
+    except subprocess.TimeoutExpired:
+        pass
+
+
+class _ThreadedServer(uvicorn.Server):
+    def __init__(self, config: uvicorn.Config) -> None:
+        super().__init__(config)
+        self.started_event = threading.Event()
+
+    async def startup(self, sockets=None) -> None:
+        await super().startup(sockets=sockets)
+        self.started_event.set()
+
+    @property
+    def bound_port(self) -> int:
+        return int(self.servers[0].sockets[0].getsockname()[1])
+
+
+class _SwappableApp:
+    # One server is shared by the whole session; each test installs its own app here.
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        await self.app(scope, receive, send)
+
+
+def _new_project(root: Path):
+    view = default_view("demo", r".*\.scaler\.json$")
+    save_view(root, view)
+    return create_app(root, "demo")
+
+
+def _wait_for_startup(server: _ThreadedServer, thread: threading.Thread, timeout: float = 15.0) -> None:
+    # uvicorn exits the thread when it cannot bind; notice that instead of waiting out the timeout.
+    deadline = time.monotonic() + timeout
+    while not server.started_event.wait(timeout=0.05):
+        if not thread.is_alive():
+            raise RuntimeError("Server thread exited during startup.")
+        if time.monotonic() > deadline:
+            raise RuntimeError("Server did not start in time.")
+
+
+@pytest.fixture(scope="session")
+def frontend_server(tmp_path_factory):
+    holder = _SwappableApp(_new_project(tmp_path_factory.mktemp("frontend-server")))
+
+    # Port 0 lets the OS pick a free port on the socket uvicorn actually serves from.
+    server = _ThreadedServer(
+        uvicorn.Config(holder, host="127.0.0.1", port=0, log_level="error", lifespan="off")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    _wait_for_startup(server, thread)
+
+    base_url = f"http://127.0.0.1:{server.bound_port}"
+
+    try:
+        yield holder, base_url
+    finally:
+        # force_exit skips waiting on lingering keep-alive connections from the browser.
+        server.should_exit = True
+        server.force_exit = True
+        thread.join(timeout=2)
+
+
+@pytest.fixture(scope="session")
+def seed_dir(tmp_path_factory) -> Path:
+    # Written once and hard-linked into each test's logs/; tests must replace these files
+    # (unlink first) rather than write through the link.
+    root = tmp_path_factory.mktemp("seed")
+    (root / "a.scaler.json").write_bytes(b'{"step": 1, "loss": 0.2, "note": "first"}')
+    return root
+
+
+@pytest.fixture()
+def frontend_env(frontend_server, seed_dir: Path, tmp_path: Path):
+    holder, base_url = frontend_server
+    app = _new_project(tmp_path)
+    logs_dir = tmp_path / "logs"
+    logs_dir.mkdir()
+    for source in seed_dir.iterdir():
+        try:
+            os.link(source, logs_dir / source.name)
+        except OSError:
+            shutil.copy2(source, logs_dir / source.name)
+    holder.app = app
+
+    def set_view(patch: dict) -> None:
+        # Preconditions go through the API directly; the UI is reserved for what is under test.
+        view = httpx.get(f"{base_url}/api/views/demo").raise_for_status().json()
+        for section, values in patch.items():
+            if isinstance(values, dict):
+                view[section].update(values)
+            else:
+                view[section] = values
+        httpx.post(f"{base_url}/api/views/demo", json=view).raise_for_status()
+
+    yield {
+        "root": tmp_path,
+        "base_url": base_url,
+        "view_file": tmp_path / ".easylogger" / "views" / "demo.json",
+        "set_view": set_view,
+    }
+
+
+_CHROMIUM_ARGS = ["--disable-dev-shm-usage", "--no-sandbox", "--disable-gpu", "--disable-extensions"]
+# The app is a data table; images and fonts never affect what the tests assert.
+_STATIC_MEDIA_URL = re.compile(r"\.(?:png|jpe?g|gif|svg|ico|woff2?|ttf|otf)(?:\?.*)?$")
+
+
+@pytest.fixture(scope="session")
+def browser():
+    # Imported here so unit tests still collect where Playwright is not installed. A failed
+    # launch (e.g. the install above could not download) skips instead of erroring.
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as playwright:
+        try:
+            shared_browser = playwright.chromium.launch(headless=True, args=_CHROMIUM_ARGS)
+        except Exception as exc:  # pragma: no cover - environment dependent
+            pytest.skip(f"Playwright Chromium is unavailable: {exc}")
+
+        try:
+            yield shared_browser
+        finally:
+            shared_browser.close()
+
+
+@pytest.fixture()
+def page(browser):
+    # A fresh context per test keeps cookies, storage and open pages isolated.
+    context = browser.new_context()
+    # Fail within seconds when the app breaks instead of Playwright's 30 s defaults.
+    context.set_default_timeout(5000)
+    context.set_default_navigation_timeout(5000)
+    context.route(_STATIC_MEDIA_URL, lambda route: route.abort())
+    try:
+        yield context.new_page()
+    finally:
+        context.close()
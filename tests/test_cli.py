@@ -2,51 +2,43 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+import typer
 from typer.testing import CliRunner
 
-from easylogger.cli import app
+from easylogger.cli import app, create, view
 from easylogger.view_store import default_view, save_view
 
 runner = CliRunner()
 
 
-def write(path: Path, content: str) -> None:
+def write(path: Path, content: bytes) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    path.write_bytes(content)
 
 
-def test_create_command_creates_view_and_scans(tmp_path: Path) -> None:
-    write(tmp_path / "logs" / "a.scaler.json", '{"step": 1, "loss": 0.2}')
+def test_create_command_creates_view_and_scans(tmp_path: Path, capsys) -> None:
+    write(tmp_path / "logs" / "a.scaler.json", b'{"step": 1, "loss": 0.2}')
 
-    result = runner.invoke(
-        app,
-        [
-            "create",
-            str(tmp_path),
-            "--pattern",
-            r".*\.scaler\.json$",
-            "--name",
-            "demo",
-        ],
-    )
+    create(root=str(tmp_path), pattern=r".*\.scaler\.json$", name="demo", warning_limit=20)
 
-    assert result.exit_code == 0
+    output = capsys.readouterr().out
     assert (tmp_path / ".easylogger" / "views" / "demo.json").exists()
-    assert "Created view 'demo'" in result.output
-    assert "matched_files=1" in result.output
+    assert "Created view 'demo'" in output
+    assert "matched_files=1" in output
 
 
-def test_view_command_reports_missing_view(tmp_path: Path) -> None:
-    result = runner.invoke(
-        app,
-        ["view", str(tmp_path), "--name", "missing", "--no-open-browser"],
-    )
+def test_view_command_reports_missing_view(tmp_path: Path, capsys) -> None:
+    with pytest.raises(typer.Exit) as exc_info:
+        view(root=str(tmp_path), name="missing", host="127.0.0.1", port=8000, open_browser=False)
 
-    assert result.exit_code == 1
-    assert "View 'missing' was not found" in result.output
-    assert "easylogger create" in result.output
+    assert exc_info.value.exit_code == 1
+    error = capsys.readouterr().err
+    assert "View 'missing' was not found" in error
+    assert "easylogger create" in error
 
 
+# Goes through CliRunner so the Typer argument/option wiring is covered end to end.
 def test_view_command_runs_uvicorn(tmp_path: Path, monkeypatch) -> None:
     save_view(tmp_path, default_view("demo", r".*"))
 
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from easylogger import json_codec
+
+
+def test_load_file_parses_small_and_large_files(tmp_path: Path) -> None:
+    small = tmp_path / "small.json"
+    small.write_text('{"step": 1, "note": "café"}', encoding="utf-8")
+    large = tmp_path / "large.json"
+    large.write_text('{"note": "' + "x" * (json_codec.MMAP_THRESHOLD + 1) + '"}', encoding="utf-8")
+
+    assert json_codec.load_file(small) == {"step": 1, "note": "café"}
+    assert len(json_codec.load_file(large)["note"]) == json_codec.MMAP_THRESHOLD + 1
+
+
+def test_load_file_falls_back_to_stdlib_json(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(json_codec, "orjson", None)
+    target = tmp_path / "a.json"
+    target.write_text('{"step": 2}', encoding="utf-8")
+
+    assert json_codec.load_file(target) == {"step": 2}
+
+    target.write_text('{"step": ', encoding="utf-8")
+    with pytest.raises(json_codec.JSONDecodeError):
+        json_codec.load_file(target)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_emits_compact_utf8_bytes(monkeypatch, use_orjson: bool) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(json_codec, "orjson", None)
+    elif json_codec.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    payload = {"rows": [{"path": "a.json", "note": "café", "ok": True, "missing": None}]}
+    encoded = json_codec.dumps(payload)
+
+    assert isinstance(encoded, bytes)
+    assert "café".encode("utf-8") in encoded
+    assert json_codec.loads(encoded) == payload
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_encodes_values_without_a_json_form(monkeypatch, use_orjson: bool) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(json_codec, "orjson", None)
+    elif json_codec.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    payload = {
+        "set": {3},
+        "big": 7 * 10**20,
+        "nan": float("nan"),
+        "nested": [{"inf": float("inf")}, frozenset({1.5})],
+        "object": Path("a.json"),
+        "when": datetime(2024, 1, 2, 3, 4, 5),
+        "day": date(2024, 1, 2),
+        "whole": Decimal("12"),
+        "ratio": Decimal("0.25"),
+        "bad": Decimal("NaN"),
+    }
+
+    decoded = json_codec.loads(json_codec.dumps(payload))
+    assert type(decoded["whole"]) is int
+    assert decoded == {
+        "set": [3],
+        "big": 7 * 10**20,
+        "nan": None,
+        "nested": [{"inf": None}, [1.5]],
+        "object": "a.json",
+        "when": "2024-01-02T03:04:05",
+        "day": "2024-01-02",
+        "whole": 12,
+        "ratio": 0.25,
+        "bad": None,
+    }
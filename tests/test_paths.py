@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from easylogger.paths import resolve_root
+
+
+def test_resolve_root_caches_absolute_roots(tmp_path: Path) -> None:
+    first = resolve_root(tmp_path)
+    assert first == tmp_path.resolve()
+    assert resolve_root(str(tmp_path)) is first
+
+
+def test_resolve_root_follows_working_directory_for_relative_roots(tmp_path: Path, monkeypatch) -> None:
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+
+    monkeypatch.chdir(tmp_path / "a")
+    assert resolve_root(".") == (tmp_path / "a").resolve()
+
+    monkeypatch.chdir(tmp_path / "b")
+    assert resolve_root(".") == (tmp_path / "b").resolve()
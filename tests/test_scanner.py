@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import math
+import os
+import re
+import time
 from pathlib import Path
 
-from easylogger.scanner import scan_records
+import pytest
+
+from easylogger import scanner
+from easylogger.scanner import scan_records, scan_records_multi
 
 
 def write(path: Path, content: str) -> None:
@@ -32,6 +39,27 @@ def test_scan_records_handles_warnings_and_ignored_dirs(tmp_path: Path) -> None:
     assert all(".git" not in warning.path for warning in result.warnings)
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_scan_records_keeps_nan_and_wide_int_logs(tmp_path: Path, monkeypatch, use_orjson: bool) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(scanner.json_codec, "orjson", None)
+    elif scanner.json_codec.orjson is None:
+        pytest.skip("orjson is not installed")
+    write(tmp_path / "nan.json", '{"loss": NaN, "best": -Infinity}')
+    write(tmp_path / "wide.json", '{"seed": 123456789012345678901234567890, "low": -9300000000000000000}')
+    write(tmp_path / "large.json", '{"loss": NaN, "note": "' + "x" * (scanner.json_codec.MMAP_THRESHOLD + 1) + '"}')
+
+    result = scan_records(tmp_path, r"\.json$")
+
+    assert result.warnings == []
+    rows = {row["path"]: row for row in result.records}
+    assert math.isnan(rows["nan.json"]["loss"])
+    assert rows["nan.json"]["best"] == float("-inf")
+    assert math.isnan(rows["large.json"]["loss"])
+    assert rows["wide.json"]["seed"] == 123456789012345678901234567890
+    assert rows["wide.json"]["low"] == -9300000000000000000
+
+
 def test_scan_records_rejects_non_directory_root(tmp_path: Path) -> None:
     file_path = tmp_path / "file.txt"
     file_path.write_text("x", encoding="utf-8")
@@ -42,3 +70,231 @@ def test_scan_records_rejects_non_directory_root(tmp_path: Path) -> None:
         assert "not a directory" in str(exc)
     else:
         raise AssertionError("Expected ValueError for non-directory root")
+
+
+def test_scan_records_walks_nested_dirs_without_following_symlinks(tmp_path: Path) -> None:
+    write(tmp_path / "a" / "b" / "c" / "deep.scaler.json", '{"step": 1}')
+    write(tmp_path / "a" / "node_modules" / "pkg.scaler.json", '{"step": 2}')
+    write(tmp_path / "outside" / "linked.scaler.json", '{"step": 3}')
+    (tmp_path / "a" / "link").symlink_to(tmp_path / "outside", target_is_directory=True)
+
+    result = scan_records(tmp_path, r".*\.scaler\.json$")
+
+    assert sorted(row["path"] for row in result.records) == [
+        "a/b/c/deep.scaler.json",
+        "outside/linked.scaler.json",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        (r".*\.json$", ["a.json", "logs/b.json"]),
+        (r"^logs/.*\.json$", ["logs/b.json"]),
+        (r".*json", ["a.json", "c.jsonl", "logs/b.json"]),
+        (r"\.jsonl$|\.json$", ["a.json", "c.jsonl", "logs/b.json"]),
+        (r"(?i)A\.json$", ["a.json"]),
+        (r"logs/b\.json$", ["logs/b.json"]),
+        (r"\djson$", []),
+        (r"c\.json[l]?$", ["c.jsonl"]),
+    ],
+)
+def test_scan_records_pattern_fast_paths_match_regex(
+    tmp_path: Path, pattern: str, expected: list[str]
+) -> None:
+    write(tmp_path / "a.json", "{}")
+    write(tmp_path / "c.jsonl", "{}")
+    write(tmp_path / "logs" / "b.json", "{}")
+    write(tmp_path / "logs" / "d.txt", "{}")
+
+    result = scan_records(tmp_path, pattern)
+
+    assert sorted(row["path"] for row in result.records) == expected
+
+
+def test_scan_records_parallel_parse_matches_sequential(tmp_path: Path, monkeypatch) -> None:
+    for index in range(12):
+        write(tmp_path / "logs" / f"{index:02}.scaler.json", f'{{"step": {index}, "meta": [1]}}')
+    write(tmp_path / "logs" / "broken.scaler.json", "{")
+    write(tmp_path / "logs" / "large.scaler.json", '{"blob": "' + "x" * 70_000 + '"}')
+
+    sequential = scan_records(tmp_path, r".*\.scaler\.json$")
+    monkeypatch.setattr(scanner, "PARALLEL_PARSE_THRESHOLD", 2)
+    monkeypatch.setattr(scanner, "READ_BATCH_SIZE", 3)
+    parallel = scan_records(tmp_path, r".*\.scaler\.json$")
+
+    assert parallel.records == sequential.records
+    assert parallel.warnings == sequential.warnings
+    assert parallel.summary == sequential.summary
+    assert parallel.summary["warning_count"] == 13
+    assert parallel.summary["parsed_records"] == 13
+
+
+def _age(path: Path, seconds: float = 60.0) -> None:
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def test_scan_records_reuses_previous_result_until_files_change(tmp_path: Path) -> None:
+    target = tmp_path / "logs" / "a.scaler.json"
+    write(target, '{"step": 1}')
+    _age(target)
+
+    first = scan_records(tmp_path, r".*\.scaler\.json$")
+    assert scan_records(tmp_path, r".*\.scaler\.json$", previous=first) is first
+
+    write(target, '{"step": 9}')
+    _age(target, 30.0)
+    changed = scan_records(tmp_path, r".*\.scaler\.json$", previous=first)
+    assert changed is not first
+    assert changed.records[0]["step"] == 9
+
+    write(tmp_path / "logs" / "b.scaler.json", '{"step": 2}')
+    added = scan_records(tmp_path, r".*\.scaler\.json$", previous=changed)
+    assert added.summary["parsed_records"] == 2
+
+
+def test_scan_records_never_reuses_recently_modified_files(tmp_path: Path) -> None:
+    write(tmp_path / "a.scaler.json", '{"step": 1}')
+    first = scan_records(tmp_path, r".*\.scaler\.json$")
+
+    assert scan_records(tmp_path, r".*\.scaler\.json$", previous=first) is not first
+
+
+def test_scan_records_reparses_only_changed_files(tmp_path: Path, monkeypatch) -> None:
+    write(tmp_path / "a.scaler.json", '{"step": 1}')
+    write(tmp_path / "b.scaler.json", '{"step": 2, "meta": []}')
+    write(tmp_path / "c.scaler.json", "{")
+    for name in ("a", "b", "c"):
+        _age(tmp_path / f"{name}.scaler.json")
+    first = scan_records(tmp_path, r".*\.scaler\.json$")
+
+    write(tmp_path / "a.scaler.json", '{"step": 10}')
+    _age(tmp_path / "a.scaler.json", 30.0)
+    write(tmp_path / "d.scaler.json", '{"step": 4}')
+
+    parsed: list[str] = []
+    parse_all = scanner._parse_all
+
+    def tracking_parse_all(matched):
+        parsed.extend(rel_path for _, rel_path in matched)
+        return parse_all(matched)
+
+    monkeypatch.setattr(scanner, "_parse_all", tracking_parse_all)
+    second = scan_records(tmp_path, r".*\.scaler\.json$", previous=first)
+
+    assert sorted(parsed) == ["a.scaler.json", "d.scaler.json"]
+    fresh = scan_records(tmp_path, r".*\.scaler\.json$")
+    assert second.records == fresh.records
+    assert second.warnings == fresh.warnings
+    assert second.summary == fresh.summary
+
+
+def test_scan_records_reuses_files_whose_log_sets_path(tmp_path: Path) -> None:
+    write(tmp_path / "logs" / "a.json", '{"path": "custom", "x": 1}')
+    write(tmp_path / "logs" / "b.json", '{"path": "logs/a.json", "x": 2}')
+    _age(tmp_path / "logs" / "a.json")
+    _age(tmp_path / "logs" / "b.json")
+    first = scan_records(tmp_path, r"\.json$")
+
+    write(tmp_path / "logs" / "b.json", '{"path": "logs/a.json", "x": 3}')
+    _age(tmp_path / "logs" / "b.json", 30.0)
+    second = scan_records(tmp_path, r"\.json$", previous=first)
+
+    assert second.records == scan_records(tmp_path, r"\.json$").records
+    assert [row["x"] for row in second.records] == [1, 3]
+
+
+def test_scan_records_multi_matches_individual_scans(tmp_path: Path) -> None:
+    write(tmp_path / "logs" / "a.scaler.json", '{"step": 1}')
+    write(tmp_path / "logs" / "b.scaler.json", '{"step": 2, "meta": {}}')
+    write(tmp_path / "eval" / "c.json", "[1]")
+    patterns = {
+        "scaler": r".*\.scaler\.json$",
+        "all": r"\.json$",
+        "none": r"^nothing$",
+        "logs": r"^logs/.*\.json$",
+        "missing": r"^missing/dir/",
+    }
+
+    results = scan_records_multi(tmp_path, patterns)
+
+    assert list(results) == list(patterns)
+    for name, pattern in patterns.items():
+        single = scan_records(tmp_path, pattern)
+        assert results[name].records == single.records
+        assert results[name].warnings == single.warnings
+        assert results[name].summary == single.summary
+    assert results["none"].summary["total_files"] == 3
+    assert results["logs"].summary["total_files"] == 2
+    assert results["missing"].summary["total_files"] == 0
+
+
+def test_scan_records_multi_rejects_invalid_pattern(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Invalid regex pattern"):
+        scan_records_multi(tmp_path, {"ok": r".*", "bad": r"("})
+
+
+def test_scan_records_prunes_walk_to_literal_prefix(tmp_path: Path) -> None:
+    write(tmp_path / "logs" / "run1" / "a.json", '{"step": 1}')
+    write(tmp_path / "logs" / "run1" / "deep" / "b.json", '{"step": 2}')
+    write(tmp_path / "logs" / "run2" / "c.json", '{"step": 3}')
+    write(tmp_path / "other" / "logs" / "run1" / "d.json", '{"step": 4}')
+    (tmp_path / "link").symlink_to(tmp_path / "logs", target_is_directory=True)
+
+    pruned = scan_records(tmp_path, r"^logs/run1/.*\.json$")
+    full = scan_records(tmp_path, r"(?:^logs/run1/.*\.json$)")
+
+    assert pruned.records == full.records
+    assert [row["path"] for row in pruned.records] == ["logs/run1/a.json", "logs/run1/deep/b.json"]
+    assert pruned.summary["total_files"] == 2
+    assert full.summary["total_files"] == 4
+
+    assert scan_records(tmp_path, r"^link/run1/").records == []
+    assert scan_records(tmp_path, r"^Logs/run1/").records == []
+    assert scan_records(tmp_path, r"^logs/run1/", ignored_dirs={"run1"}).records == []
+    assert len(scan_records(tmp_path, r"^logs/run[12]?/").records) == 3
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        r".*\.scaler\.json$",
+        r"run\d/\w+\.json$",
+        r"\\json$",
+        r"b/c-d_e\.json$",
+        r"json?$",
+        r"\.json\$",
+        r".*\x2ejson$",
+        r"run\d/a\.json$",
+    ],
+)
+def test_scan_records_suffix_prefilter_agrees_with_regex(tmp_path: Path, pattern: str) -> None:
+    names = [
+        "run1/a.scaler.json",
+        "run1/a.json",
+        "run2/b/c-d_e.json",
+        "run2/b/xc-d_e.json",
+        "run3/notjson",
+        "run3/a.jsonl",
+        "run3/weird.json$",
+    ]
+    for name in names:
+        write(tmp_path / name, "{}")
+
+    result = scan_records(tmp_path, pattern)
+
+    expected = sorted(name for name in names if re.search(pattern, name))
+    assert sorted(row["path"] for row in result.records) == expected
+
+
+def test_scan_records_accepts_compiled_patterns(tmp_path: Path) -> None:
+    write(tmp_path / "logs" / "a.json", '{"step": 1}')
+    write(tmp_path / "Logs" / "B.JSON", '{"step": 2}')
+
+    plain = scan_records(tmp_path, re.compile(r"^logs/.*\.json$"))
+    assert [row["path"] for row in plain.records] == ["logs/a.json"]
+
+    # Flags change what the source text means, so no literal prefix/suffix shortcut applies.
+    insensitive = scan_records(tmp_path, re.compile(r"^logs/.*\.json$", re.IGNORECASE))
+    assert sorted(row["path"] for row in insensitive.records) == ["Logs/B.JSON", "logs/a.json"]
@@ -3,6 +3,7 @@ from __future__ import annotations
 import pytest
 
 from easylogger.models import ViewConfig
+from easylogger import view_engine
 from easylogger.view_engine import apply_view
 
 
@@ -65,6 +66,20 @@ def test_computed_expression_failure_becomes_error_string() -> None:
     assert table.rows[0]["bad"].startswith("ERROR:")
 
 
+def test_computed_expression_syntax_error_marks_every_row() -> None:
+    records = [{"path": "run/a.scaler.json"}, {"path": "run/b.scaler.json"}]
+    view = ViewConfig.model_validate(
+        {
+            "name": "demo",
+            "pattern": ".*",
+            "columns": {"computed": [{"name": "bad", "expr": 'row["loss"] +'}]},
+        }
+    )
+
+    table = apply_view(records, view)
+    assert all(row["bad"].startswith("ERROR:") for row in table.rows)
+
+
 def test_column_format_uses_python_template_and_reports_errors() -> None:
     records = [
         {"path": "run/a.scaler.json", "step": 7, "loss": 0.12345},
@@ -154,3 +169,103 @@ def test_column_format_coerces_numeric_like_strings() -> None:
 
     table = apply_view(records, view)
     assert table.rows[0]["latency_ms"] == "12.7ms"
+
+
+def test_apply_view_never_mutates_input_records() -> None:
+    records = [
+        {"path": "run/a.scaler.json", "step": 1},
+        {"path": "run/b.scaler.json", "step": 2, "loss": 0.5},
+    ]
+    snapshot = [dict(record) for record in records]
+    view = ViewConfig.model_validate(
+        {
+            "name": "demo",
+            "pattern": ".*",
+            "columns": {
+                "format": {"step": "{d:03}"},
+                "computed": [{"name": "double", "expr": 'row["step"] * 2'}],
+            },
+        }
+    )
+
+    apply_view(records, view)
+    plain = apply_view(records, ViewConfig.model_validate({"name": "demo", "pattern": ".*"}))
+
+    assert records == snapshot
+    assert plain.rows[0] == {"path": "run/a.scaler.json", "step": 1, "loss": None}
+
+
+@pytest.mark.parametrize(
+    ("direction", "expected"),
+    [
+        ("asc", ["int", "num_str", "float", "bool", "nan", "text", "missing", "none"]),
+        ("desc", ["missing", "none", "text", "nan", "bool", "float", "num_str", "int"]),
+    ],
+)
+def test_sort_orders_numbers_then_text_then_missing(direction: str, expected: list[str]) -> None:
+    records = [
+        {"path": "missing"},
+        {"path": "text", "value": "zeta"},
+        {"path": "float", "value": 7.5},
+        {"path": "none", "value": None},
+        {"path": "bool", "value": True},
+        {"path": "num_str", "value": " 3 "},
+        {"path": "nan", "value": float("nan")},
+        {"path": "int", "value": -2},
+    ]
+    view = ViewConfig.model_validate(
+        {"name": "demo", "pattern": ".*", "rows": {"sort": {"by": "value", "direction": direction}}}
+    )
+
+    table = apply_view(records, view)
+    assert [row["path"] for row in table.rows] == expected
+
+
+def test_computed_expression_can_use_row_inside_comprehensions() -> None:
+    records = [{"path": "run/a.scaler.json", "step": 2, "loss": 0.5}]
+    view = ViewConfig.model_validate(
+        {
+            "name": "demo",
+            "pattern": ".*",
+            "columns": {"computed": [{"name": "total", "expr": 'sum(row[key] for key in ("step", "loss"))'}]},
+        }
+    )
+
+    table = apply_view(records, view)
+    assert table.rows[0]["total"] == 2.5
+
+
+def test_computed_expression_names_do_not_leak_between_evals() -> None:
+    records = [{"path": "a", "step": 1}, {"path": "b", "step": 2}]
+    view = ViewConfig.model_validate(
+        {
+            "name": "demo",
+            "pattern": ".*",
+            "columns": {
+                "computed": [
+                    {"name": "a", "expr": "(t := row['step'])"},
+                    {"name": "b", "expr": "t * 10"},
+                ]
+            },
+        }
+    )
+
+    table = apply_view(records, view)
+    assert [row["a"] for row in table.rows] == [1, 2]
+    assert all(row["b"] == "ERROR: name 't' is not defined" for row in table.rows)
+
+
+def test_sort_caches_only_short_text_cells() -> None:
+    view_engine._parse_cached_text.cache_clear()
+    long_number = "1" * 40
+    records = [
+        {"path": "a", "value": "2"},
+        {"path": "b", "value": "free text " * 10},
+        {"path": "c", "value": long_number},
+    ]
+    view = ViewConfig.model_validate({"name": "demo", "pattern": ".*", "rows": {"sort": {"by": "value"}}})
+
+    table = apply_view(records, view)
+
+    assert [row["path"] for row in table.rows] == ["a", "c", "b"]
+    assert view_engine._parse_cached_text.cache_info().currsize == 1
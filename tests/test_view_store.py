@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import time
 from pathlib import Path
 
 import pytest
@@ -14,6 +16,7 @@ from easylogger.view_store import (
     rename_view,
     save_view,
     view_path,
+    views_dir,
 )
 
 
@@ -66,3 +69,49 @@ def test_create_and_rename_view(tmp_path: Path) -> None:
     renamed = rename_view(tmp_path, "copy", "renamed")
     assert renamed.name == "renamed"
     assert sorted(list_views(tmp_path)) == ["base", "renamed"]
+
+
+def test_load_view_handles_large_view_files(tmp_path: Path) -> None:
+    view = default_view(name="big", pattern=r".*")
+    view.rows.pinned_ids = [f"runs/{index:05}/result.scaler.json" for index in range(4000)]
+    path = save_view(tmp_path, view)
+    assert path.stat().st_size > 64 * 1024
+
+    assert load_view(tmp_path, "big").rows.pinned_ids == view.rows.pinned_ids
+
+
+def test_load_view_reuses_parsed_view_until_file_changes(tmp_path: Path) -> None:
+    path = save_view(tmp_path, default_view(name="demo", pattern=r".*"))
+    past = time.time() - 60
+    os.utime(path, (past, past))
+
+    first = load_view(tmp_path, "demo")
+    assert load_view(tmp_path, "demo") is first
+
+    save_view(tmp_path, default_view(name="demo", pattern=r"^logs/"))
+    assert load_view(tmp_path, "demo").pattern == r"^logs/"
+
+    os.utime(path, (past, past))
+    cached = load_view(tmp_path, "demo")
+    renamed = rename_view(tmp_path, "demo", "exp2")
+    assert cached.name == "demo"
+    assert renamed.name == "exp2"
+    with pytest.raises(ViewNotFoundError):
+        load_view(tmp_path, "demo")
+
+
+def test_load_view_reports_malformed_view_file(tmp_path: Path) -> None:
+    path = view_path(tmp_path, "demo")
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b'{"name": "demo", ')
+
+    with pytest.raises(ValueError, match="Failed to read view file"):
+        load_view(tmp_path, "demo")
+
+
+def test_save_view_replaces_file_without_leaving_temporaries(tmp_path: Path) -> None:
+    save_view(tmp_path, default_view("demo", r".*"))
+    save_view(tmp_path, default_view("demo", r".*\.json$"))
+
+    assert [path.name for path in views_dir(tmp_path).iterdir()] == ["demo.json"]
+    assert load_view(tmp_path, "demo").pattern == r".*\.json$"
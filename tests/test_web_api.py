@@ -4,6 +4,7 @@ from pathlib import Path
 
 from fastapi.testclient import TestClient
 
+from easylogger import web_api
 from easylogger.models import ComputedColumn
 from easylogger.view_store import default_view, save_view
 from easylogger.web_api import create_app
@@ -144,3 +145,76 @@ def test_web_api_keeps_scan_cache_per_view(tmp_path: Path) -> None:
     assert [row["path"] for row in render_a.json()["rows"]] == ["a.scaler.json"]
     # Cached render should still show old step before refresh-scan.
     assert render_a.json()["rows"][0]["step"] == 1
+
+    # An in-place rewrite keeps the file size, but refresh must still pick it up.
+    rescan_a = client.post("/api/scan", json={"view_name": "a"})
+    assert rescan_a.json()["rows"][0]["step"] == 9
+
+
+def test_web_api_scan_streams_rows_in_chunks(tmp_path: Path, monkeypatch) -> None:
+    save_view(tmp_path, default_view("demo", r".*\.scaler\.json$"))
+    for index in range(5):
+        write(tmp_path / "logs" / f"{index}.scaler.json", f'{{"step": {index}}}')
+    write(tmp_path / "logs" / "bad.scaler.json", "{")
+    monkeypatch.setattr(web_api, "STREAM_CHUNK_ROWS", 2)
+
+    client = TestClient(create_app(tmp_path, "demo"))
+    payload = client.post("/api/scan", json={}).json()
+
+    assert sorted(row["step"] for row in payload["rows"]) == [0, 1, 2, 3, 4]
+    assert payload["summary"]["parsed_records"] == 5
+    assert [warning["path"] for warning in payload["warnings"]] == ["logs/bad.scaler.json"]
+    assert payload["columns"]["visible"] == ["path", "step"]
+
+
+def test_web_api_scan_streams_values_without_a_json_form(tmp_path: Path) -> None:
+    view = default_view("demo", r".*\.scaler\.json$")
+    view.columns.computed = [
+        ComputedColumn(name="tags", expr="{row['step']}"),
+        ComputedColumn(name="big", expr="row['step'] * 10**18"),
+        ComputedColumn(name="loop", expr="(lambda items: items.append(items) or items)([])"),
+    ]
+    save_view(tmp_path, view)
+    write(tmp_path / "logs" / "a.scaler.json", '{"step": 20}')
+
+    client = TestClient(create_app(tmp_path, "demo"))
+    for endpoint in ("/api/scan", "/api/render"):
+        response = client.post(endpoint, json={})
+
+        assert response.status_code == 200
+        row = response.json()["rows"][0]
+        assert row["tags"] == [20]
+        assert row["big"] == 20 * 10**18
+        assert row["loop"].startswith("ENCODE_ERROR:")
+
+
+def test_web_api_render_replays_body_for_unchanged_view(tmp_path: Path, monkeypatch) -> None:
+    view = default_view("demo", r".*\.scaler\.json$")
+    save_view(tmp_path, view)
+    write(tmp_path / "logs" / "a.scaler.json", '{"step": 1, "loss": 0.2}')
+
+    calls: list[str] = []
+    original = web_api.apply_view
+
+    def counting_apply_view(records, active_view):
+        calls.append(active_view.name)
+        return original(records, active_view)
+
+    monkeypatch.setattr(web_api, "apply_view", counting_apply_view)
+    client = TestClient(create_app(tmp_path, "demo"))
+    payload = {"view_name": "demo", "view": view.model_dump()}
+
+    first = client.post("/api/render", json=payload)
+    second = client.post("/api/render", json=payload)
+    assert second.content == first.content
+    assert len(calls) == 1
+
+    payload["view"]["columns"]["hidden"] = ["loss"]
+    changed = client.post("/api/render", json=payload)
+    assert changed.json()["columns"]["hidden"] == ["loss"]
+    assert len(calls) == 2
+
+    write(tmp_path / "logs" / "b.scaler.json", '{"step": 2}')
+    client.post("/api/scan", json=payload)
+    rescanned = client.post("/api/render", json=payload)
+    assert len(rescanned.json()["rows"]) == 2